@@ -7,6 +7,7 @@ from .validators import _validate_resource_list
 
 
 class DataAccountCreate(Packet):
+    __slots__ = ()
     _packet_type = 'data_account_create'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID']
@@ -15,6 +16,7 @@ class DataAccountCreate(Packet):
 
 
 class NotifyAccountCreate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_account_create'
     _expected_reply = [{'type': 'data_account_create', 'timeout': 30240}]
     _data_keys_required = [
@@ -78,6 +80,7 @@ class NotifyAccountCreate(Packet):
 
 
 class NotifyAccountInactivate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_account_inactivate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID', 'ResourceList']
@@ -100,6 +103,7 @@ class NotifyAccountInactivate(Packet):
 
 
 class NotifyAccountReactivate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_account_reactivate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID', 'ResourceList']
@@ -122,6 +126,7 @@ class NotifyAccountReactivate(Packet):
 
 
 class RequestAccountCreate(Packet):
+    __slots__ = ()
     _packet_type = 'request_account_create'
     _expected_reply = ['notify_account_create']
     _data_keys_required = [
@@ -181,6 +186,7 @@ class RequestAccountCreate(Packet):
 
 
 class RequestAccountInactivate(Packet):
+    __slots__ = ()
     _packet_type = 'request_account_inactivate'
     _expected_reply = [{'type': 'notify_account_inactivate', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID', 'ResourceList']
@@ -203,6 +209,7 @@ class RequestAccountInactivate(Packet):
 
 
 class RequestAccountReactivate(Packet):
+    __slots__ = ()
     _packet_type = 'request_account_reactivate'
     _expected_reply = [{'type': 'notify_account_reactivate', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID', 'ResourceList']
@@ -1,9 +1,58 @@
 import json
+import sys
 
+from collections.abc import Mapping
 from datetime import datetime
-from collections import defaultdict
+from operator import is_
 from dateutil.parser import parse as dtparse
 
+try:
+    # orjson is optional; it's a good deal faster than the json module
+    # for both parsing and serializing packets
+    import orjson as _json_fast
+except ImportError:
+    _json_fast = None
+
+
+# datetime.fromisoformat is only available on Python 3.7+, and only
+# accepts a trailing 'Z' for UTC on 3.11+
+_fromisoformat = getattr(datetime, 'fromisoformat', None)
+_fromisoformat_handles_z = sys.version_info >= (3, 11)
+
+
+def _parse_date(value):
+    """
+    Parses a date string into a datetime. Dates on the wire are almost always
+    ISO 8601, so try the (much faster) datetime.fromisoformat first, and fall
+    back to dateutil for anything else.
+    """
+    if _fromisoformat is not None and isinstance(value, str):
+        if not _fromisoformat_handles_z and value.endswith('Z'):
+            iso_value = value[:-1] + '+00:00'
+        else:
+            iso_value = value
+        try:
+            return _fromisoformat(iso_value)
+        except ValueError:
+            pass
+    return dtparse(value)
+
+
+def _loads_bytes(json_bytes):
+    """
+    Parses UTF-8 encoded JSON from a bytes-like object. Strings are
+    rejected whichever JSON library is used, so the accepted types don't
+    depend on whether orjson is installed.
+    """
+    if isinstance(json_bytes, str):
+        raise TypeError("Expected bytes, bytearray or memoryview, not str; "
+                        "use from_json() for strings")
+    if _json_fast is not None:
+        return _json_fast.loads(json_bytes)
+    if not isinstance(json_bytes, bytes):
+        json_bytes = bytes(json_bytes)
+    return json.loads(json_bytes.decode('utf-8'))
+
 
 class PacketInvalidData(Exception):
     """Raised when we try to build a packet with invalid data"""
@@ -16,52 +65,44 @@ class PacketInvalidType(Exception):
 
 # Closures, for properly handling properties
 # in the metaclass
-def _make_get_required(key):
-    def get_required(self):
-        return self._required_data.get(key)
-    return get_required
+def _make_get_data(key):
+    def get_data(self):
+        return self._data.get(key)
+    return get_data
 
 
-def _make_set_required(key):
-    def set_required(self, value):
-        self._required_data[key] = value
-    return set_required
+def _make_set_data(key):
+    def set_data(self, value):
+        self._data[key] = value
+        if self._json_cache is not None:
+            self._json_cache = None
+    return set_data
 
 
 def _make_del_required(key):
     def del_required(self):
-        self._required_data[key] = None
+        # Deleting a required field resets it to None rather than
+        # removing it, so it still shows up as missing
+        self._data[key] = None
+        if self._json_cache is not None:
+            self._json_cache = None
     return del_required
 
 
-def _make_get_allowed(key):
-    def get_allowed(self):
-        return self._allowed_data.get(key)
-    return get_allowed
-
-
-def _make_set_allowed(key):
-    def set_allowed(self, value):
-        self._allowed_data[key] = value
-    return set_allowed
-
-
 class MetaPacket(type):
     """Metaclass for packets.
 
     Looks at the _data_keys_allowed and _data_keys_required attributes
     when a subclass is declared, then adds class properties that
-    stores the information in two separate dictionaries on the object.
+    store the information in a dictionary on the object.
     """
     def __new__(cls, name, base, attrs):
-        required_fields = attrs.get('_data_keys_required', [])
-        allowed_fields = attrs.get('_data_keys_allowed', [])
-        for k in required_fields:
-            attrs[k] = property(_make_get_required(k),
-                                _make_set_required(k),
+        for k in attrs.get('_data_keys_allowed', []):
+            attrs[k] = property(_make_get_data(k), _make_set_data(k))
+        for k in attrs.get('_data_keys_required', []):
+            attrs[k] = property(_make_get_data(k),
+                                _make_set_data(k),
                                 _make_del_required(k))
-        for k in allowed_fields:
-            attrs[k] = property(_make_get_allowed(k), _make_set_allowed(k))
 
         # fix expected_replies to add a default timeouts
         expected_replies = attrs.get('_expected_reply', [])
@@ -82,7 +123,28 @@ class MetaPacket(type):
             else:
                 raise Exception("Invalid reply_type")
         attrs['expected_reply'] = expected_with_timeouts
-        return type.__new__(cls, name, base, attrs)
+        cls_obj = type.__new__(cls, name, base, attrs)
+        # All the data keys (required or allowed), for sorting body kwargs
+        cls_obj._data_set = frozenset(list(cls_obj._data_keys_required)
+                                      + list(cls_obj._data_keys_allowed))
+        # Required fields the server can't infer for a reply packet
+        cls_obj._required_in_reply = tuple(
+            k for k in cls_obj._data_keys_required
+            if k not in cls_obj._data_keys_not_required_in_reply
+        )
+        # Fields with 'Date' in the name hold dates, and get parsed into
+        # datetimes. TODO check if this is a valid assumption
+        cls_obj._date_fields = frozenset(
+            k for k in cls_obj._data_set
+            if 'Date' in k
+        )
+
+        # Register the packet type, so _find_packet_type is a dict lookup.
+        # The first class declared for a type wins.
+        packet_type = attrs.get('_packet_type')
+        if packet_type is not None:
+            cls_obj._type_registry.setdefault(packet_type, cls_obj)
+        return cls_obj
 
 
 class Packet(object, metaclass=MetaPacket):
@@ -98,17 +160,28 @@ class Packet(object, metaclass=MetaPacket):
                                           this is a reply packet
         _data_keys_allowed: Data keys that are allowed for this packet type
 
+    Packet itself uses __slots__. Subclasses get an instance __dict__ unless
+    they declare ``__slots__ = ()``, as the packet types in this package do.
 
     Args:
         packet_rec_id (str): The ID for this packet
         date (datetime.Datetime): A datetime object representing this packet's date attribute
         additional_data (dict): Body data that is outsite the AMIE spec.
-        in_reply_to (str, int, amieclient.Packet): The packet this packet is in response to. Can take a packet, int, string, or None.
+        in_reply_to (str, int, dict, amieclient.Packet): The packet this packet is in response to. Can take a packet, a packet dict, int, string, or None.
     """
     _data_keys_required = []
     _data_keys_not_required_in_reply = []
     _data_keys_allowed = []
     _expected_replies = []
+    # Maps _packet_type to packet class, filled in by MetaPacket
+    _type_registry = {}
+
+    __slots__ = ('_data', 'packet_rec_id', 'packet_id', 'trans_rec_id',
+                 'transaction_id', 'local_site_name', 'remote_site_name',
+                 'originating_site_name', 'outgoing_flag',
+                 'transaction_state', 'client_state', 'packet_state',
+                 '_client_json', '_original_data', 'additional_data',
+                 'date', 'in_reply_to_id', '_json_cache', '__weakref__')
 
     def __init__(self, packet_rec_id=None, trans_rec_id=None,
                  packet_id=None, transaction_id=None,
@@ -120,9 +193,9 @@ class Packet(object, metaclass=MetaPacket):
                  transaction_state=None, packet_state=None,
                  _original_data=None,
                  **kwargs):
-        # Set up empty data dicts
-        self._required_data = dict()
-        self._allowed_data = dict()
+        self._json_cache = None
+        # Set up empty data dict, for both required and allowed data
+        self._data = dict()
 
         self.packet_rec_id = int(packet_rec_id) if packet_rec_id is not None else None
         self.packet_id = int(packet_id) if packet_id is not None else None
@@ -145,34 +218,53 @@ class Packet(object, metaclass=MetaPacket):
         # meaning the JSON we got from the server
         self._original_data = _original_data
 
-        self.additional_data = additional_data if additional_data is not None else {}
+        # Copy additional_data, since body kwargs outside the spec get added
+        # to it below, and we don't want to modify the caller's dict
+        self.additional_data = dict(additional_data) if additional_data is not None else {}
         if date is not None:
-            self.date = dtparse(date)
+            self.date = _parse_date(date)
         else:
             self.date = None
 
-        if in_reply_to is None or isinstance(in_reply_to, int):
-            # If we're given a string, or None, just use that.
-            self.in_reply_to_id = in_reply_to
+        if in_reply_to is None:
+            in_reply_to_id = None
         elif isinstance(in_reply_to, str):
             # If it's a string, make it an int
-            self.in_reply_to_id = int(in_reply_to)
+            in_reply_to_id = int(in_reply_to)
+        elif isinstance(in_reply_to, int):
+            in_reply_to_id = in_reply_to
+        elif isinstance(in_reply_to, Mapping):
+            # If we're given a packet as a dict-like object, get the ID
+            # from the header
+            in_reply_to_id = in_reply_to.get('header', {}).get('packet_rec_id')
+            if in_reply_to_id is None:
+                raise PacketInvalidData("in_reply_to has no header packet_rec_id")
         elif hasattr(in_reply_to, 'packet_rec_id'):
             # If we're given a packet object, get the ID
-            self.in_reply_to_id = in_reply_to.packet_rec_id
-        elif in_reply_to.get('header', {}).get('packet_rec_id'):
-            # If we're given a dict-like object, get the ID from the header
-            self.in_reply_to_id = in_reply_to['header']['packet_rec_id']
+            in_reply_to_id = in_reply_to.packet_rec_id
+        else:
+            error_str = "Unsupported type for in_reply_to: '{}'".format(type(in_reply_to).__name__)
+            raise PacketInvalidData(error_str)
+        self.in_reply_to_id = in_reply_to_id
 
+        self._apply_kwargs(kwargs)
+
+    def _apply_kwargs(self, kwargs):
+        """
+        Sorts packet body data into the data and additional data dicts,
+        writing to them directly rather than going through the field
+        properties for every key.
+        """
+        cls = type(self)
+        data_set = cls._data_set
+        date_fields = cls._date_fields
+        data = self._data
+        additional_data = self.additional_data
         for key, value in kwargs.items():
-            if key in self._data_keys_required or key in self._data_keys_allowed:
-                if 'Date' in key:
-                    # TODO check if this is a valid assumption
-                    setattr(self, key, dtparse(value))
-                else:
-                    setattr(self, key, value)
+            if key in data_set:
+                data[key] = _parse_date(value) if key in date_fields else value
             else:
-                self.additional_data[key] = value
+                additional_data[key] = value
 
     @property
     def client_json(self):
@@ -195,16 +287,12 @@ class Packet(object, metaclass=MetaPacket):
         Finds the class for the given packet or packet type
         """
         pkt_cls = None
-        if type(packet_or_packet_type) == str:
-            # We're given a string, search in
-            # subclasses
-            for subclass in Packet.__subclasses__():
-                if subclass._packet_type == packet_or_packet_type:
-                    pkt_cls = subclass
-                    break
-        elif packet_or_packet_type.__class__ in Packet.__subclasses__():
-            # We've been given a packet, just get its class attribute
-            pkt_cls = packet_or_packet_type.__class__
+        if isinstance(packet_or_packet_type, str):
+            # We're given a string, look it up in the registry
+            pkt_cls = Packet._type_registry.get(packet_or_packet_type)
+        elif isinstance(packet_or_packet_type, Packet):
+            # We've been given a packet, just get its class
+            pkt_cls = type(packet_or_packet_type)
 
         if pkt_cls is None:
             # Raise a NotImplementedError if we can't find a subclass
@@ -251,7 +339,24 @@ class Packet(object, metaclass=MetaPacket):
         Args:
             json_string (string): JSON data
         """
-        data = json.loads(json_string)
+        if _json_fast is not None:
+            data = _json_fast.loads(json_string)
+        else:
+            data = json.loads(json_string)
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_bytes(cls, json_bytes):
+        """
+        Generates an instance of an AMIE packet of this type from provided
+        UTF-8 encoded JSON, e.g. straight from a response body. With orjson
+        installed, the bytes are parsed without decoding them to a string
+        first.
+
+        Args:
+            json_bytes (bytes, bytearray, memoryview): JSON data
+        """
+        data = _loads_bytes(json_bytes)
         return cls.from_dict(data)
 
     def reply_packet(self, packet_rec_id=None, packet_type=None, force=False):
@@ -302,11 +407,13 @@ class Packet(object, metaclass=MetaPacket):
         data_body = {}
         # Filter out non-defined items from our data collections, converting
         # if neccessary
-        for d in [self._required_data, self._allowed_data, self.additional_data]:
+        for d in (self._data, self.additional_data):
             for k, v in d.items():
-                if type(v) == datetime:
+                if v is None:
+                    continue
+                elif v.__class__ is datetime:
                     data_body[k] = v.isoformat()
-                elif v is not None:
+                else:
                     data_body[k] = v
 
         header = {
@@ -322,42 +429,97 @@ class Packet(object, metaclass=MetaPacket):
             'transaction_state': self.transaction_state,
             'packet_state': self.packet_state,
         }
-        if self.date is not None:
-            header['date'] = self.date.isoformat()
+        # Optional header items. Read client_json from its slot, rather than
+        # calling the property twice.
+        date = self.date
+        if date is not None:
+            header['date'] = date.isoformat()
         if self.in_reply_to_id:
             header['in_reply_to'] = self.in_reply_to_id
         if self.client_state:
             header['client_state'] = self.client_state
-        if self.client_json:
-            header['client_json'] = self.client_json
-        data_dict = {
+        client_json = self._client_json
+        if client_json:
+            header['client_json'] = client_json
+
+        return {
             'DATA_TYPE': 'packet',
-            'type': self.packet_type,
+            'type': self._packet_type,
             'body': data_body,
             'header': header
         }
 
-        return data_dict
-
     def missing_attributes(self):
         """
         Returns a list of attributes that need to be filled out by the user in
         order for this packet to be valid.
         """
         if self.in_reply_to_id:
-            reqd = list(set(self._data_keys_required)
-                        - set(self._data_keys_not_required_in_reply))
+            reqd = self._required_in_reply
         else:
             reqd = self._data_keys_required
 
-        missing = [r for r in reqd if self._required_data.get(r) is None]
+        missing = [r for r in reqd if self._data.get(r) is None]
         return missing
 
-    def json(self, **json_kwargs):
+    def json(self, cache=False, **json_kwargs):
         """
         The JSON representation of this AMIE packet
+
+        Uses orjson if it's installed and no json_kwargs are given, since
+        orjson doesn't support the json.dumps() formatting options. The
+        output format depends on which one is used: orjson writes compact
+        separators (no spaces after ',' and ':') and non-ASCII characters as
+        raw UTF-8, while json.dumps() adds spaces and escapes them as \\uXXXX.
+        Both parse back to the same data.
+
+        Args:
+            cache (bool): If True (and no json_kwargs are given), reuse the
+                JSON from an earlier json(cache=True) call, e.g. when the
+                same packet gets logged, stored and forwarded. The cache is
+                cleared when a data field of the packet is set or deleted,
+                and isn't used if any header attribute (or additional_data)
+                has been reassigned since. If you modify a list or dict on
+                the packet in place (e.g. packet.ResourceList.append(...)),
+                call invalidate_json() so the next call picks up the change.
         """
-        return json.dumps(self.as_dict(), **json_kwargs)
+        if json_kwargs:
+            return json.dumps(self.as_dict(), **json_kwargs)
+        if cache:
+            header_values = self._header_values()
+            cached = self._json_cache
+            if cached is not None:
+                cached_header_values, json_str = cached
+                # Compare by identity, so any reassignment counts as a change
+                if all(map(is_, header_values, cached_header_values)):
+                    return json_str
+        if _json_fast is not None:
+            json_str = _json_fast.dumps(self.as_dict(),
+                                        option=_json_fast.OPT_NON_STR_KEYS).decode('utf-8')
+        else:
+            json_str = json.dumps(self.as_dict())
+        if cache:
+            self._json_cache = (header_values, json_str)
+        return json_str
+
+    def _header_values(self):
+        """
+        The attributes, other than the data fields, that go into as_dict().
+        Used to tell whether cached JSON is still current.
+        """
+        return (self.packet_rec_id, self.packet_id, self.transaction_id,
+                self.trans_rec_id, self.local_site_name, self.remote_site_name,
+                self.originating_site_name, self.outgoing_flag,
+                self.transaction_state, self.packet_state, self.date,
+                self.in_reply_to_id, self.client_state, self._client_json,
+                self.additional_data)
+
+    def invalidate_json(self):
+        """
+        Clears the JSON cached by json(cache=True), e.g. after modifying
+        the packet's data in place
+        """
+        self._json_cache = None
 
     def pretty_print(self):
         """
@@ -374,14 +536,17 @@ class Packet(object, metaclass=MetaPacket):
 
         Some packet types will override this function, or add additional checks.
         """
-        for k, v in self._required_data.items():
-            # If this is a packet in reply to another, and this key is one that
-            # the server can infer, skip it.
-            if (self.in_reply_to_id and
-               k in self._data_keys_not_required_in_reply):
-                continue
-            # Otherwise, throw an error or return false.
-            elif v is None:
+        # If this is a packet in reply to another, skip the keys that the
+        # server can infer.
+        if self.in_reply_to_id:
+            reqd = self._required_in_reply
+        else:
+            reqd = self._data_keys_required
+        data = self._data
+        for k in reqd:
+            # Only check required data that's been set, and throw an error or
+            # return false if it's been cleared.
+            if k in data and data[k] is None:
                 if raise_on_invalid:
                     raise PacketInvalidData('Missing required data field: "{}"'.format(k))
                 else:
@@ -2,6 +2,7 @@ from .base import Packet
 
 
 class InformTransactionComplete(Packet):
+    __slots__ = ()
     _packet_type = 'inform_transaction_complete'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['DetailCode', 'Message', 'StatusCode']
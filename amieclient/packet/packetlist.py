@@ -1,6 +1,6 @@
 import json
 
-from .base import Packet
+from .base import Packet, _json_fast, _loads_bytes
 
 
 class PacketList(object):
@@ -24,7 +24,19 @@ class PacketList(object):
 
     @classmethod
     def from_json(cls, json_in):
-        pkt_list_in = json.loads(json_in)
+        if _json_fast is not None:
+            pkt_list_in = _json_fast.loads(json_in)
+        else:
+            pkt_list_in = json.loads(json_in)
+        return cls.from_dict(pkt_list_in)
+
+    @classmethod
+    def from_bytes(cls, json_bytes):
+        """
+        Generates a PacketList from UTF-8 encoded JSON, without decoding it
+        to a string first if orjson is installed.
+        """
+        pkt_list_in = _loads_bytes(json_bytes)
         return cls.from_dict(pkt_list_in)
 
     def as_dict(self):
@@ -37,7 +49,14 @@ class PacketList(object):
     def json(self, **json_kwargs):
         """
         The JSON representation of these AMIE packets
+
+        Uses orjson if it's installed and no json_kwargs are given. As with
+        Packet.json(), the output is then compact and keeps non-ASCII
+        characters as raw UTF-8 rather than \\uXXXX escapes.
         """
+        if _json_fast is not None and not json_kwargs:
+            return _json_fast.dumps(self.as_dict(),
+                                    option=_json_fast.OPT_NON_STR_KEYS).decode('utf-8')
         return json.dumps(self.as_dict(), **json_kwargs)
 
     def pretty_print(self):
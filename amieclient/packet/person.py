@@ -6,6 +6,7 @@ from .base import Packet, PacketInvalidData
 
 
 class NotifyPersonDuplicate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_person_duplicate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = []
@@ -18,14 +19,14 @@ class NotifyPersonDuplicate(Packet):
         make sure that either a global ID or person ID is provided for
         the two duplicate people
         """
-        if (self._allowed_data.get('GlobalID1') is None and
-                self._allowed_data.get('PersonID1') is None):
+        if (self._data.get('GlobalID1') is None and
+                self._data.get('PersonID1') is None):
             if raise_on_invalid:
                 raise PacketInvalidData('Must provide either GlobalID1 or PersonID1')
             else:
                 return False
-        if (self._allowed_data.get('GlobalID2') is None and
-                self._allowed_data.get('PersonID2') is None):
+        if (self._data.get('GlobalID2') is None and
+                self._data.get('PersonID2') is None):
             if raise_on_invalid:
                 raise PacketInvalidData('Must provide either GlobalID2 or PersonID2')
             else:
@@ -34,6 +35,7 @@ class NotifyPersonDuplicate(Packet):
 
 
 class NotifyPersonIDs(Packet):
+    __slots__ = ()
     _packet_type = 'notify_person_ids'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'PrimaryPersonID']
@@ -42,6 +44,7 @@ class NotifyPersonIDs(Packet):
 
 
 class RequestPersonMerge(Packet):
+    __slots__ = ()
     _packet_type = 'request_person_merge'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['KeepGlobalID', 'KeepPersonID', 'DeleteGlobalID',
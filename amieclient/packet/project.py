@@ -7,6 +7,7 @@ from .validators import _validate_resource_list
 
 
 class DataProjectCreate(Packet):
+    __slots__ = ()
     _packet_type = 'data_project_create'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['PersonID', 'ProjectID']
@@ -15,6 +16,7 @@ class DataProjectCreate(Packet):
 
 
 class NotifyProjectCreate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_project_create'
     _expected_reply = [{'type': 'data_project_create', 'timeout': 30240}]
     _data_keys_required = [
@@ -91,6 +93,7 @@ class NotifyProjectCreate(Packet):
 
 
 class NotifyProjectInactivate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_project_inactivate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['ProjectID', 'ResourceList']
@@ -115,6 +118,7 @@ class NotifyProjectInactivate(Packet):
 
 
 class NotifyProjectReactivate(Packet):
+    __slots__ = ()
     _packet_type = 'notify_project_reactivate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = ['ProjectID', 'ResourceList']
@@ -139,6 +143,7 @@ class NotifyProjectReactivate(Packet):
 
 
 class RequestProjectCreate(Packet):
+    __slots__ = ()
     _packet_type = 'request_project_create'
     _expected_reply = [{'type': 'notify_project_create', 'timeout': 30240}]
     _data_keys_required = [
@@ -211,6 +216,7 @@ class RequestProjectCreate(Packet):
 
 
 class RequestProjectInactivate(Packet):
+    __slots__ = ()
     _packet_type = 'request_project_inactivate'
     _expected_reply = [{'type': 'notify_project_inactivate', 'timeout': 30240}]
     _data_keys_required = ['ProjectID', 'ResourceList']
@@ -240,6 +246,7 @@ class RequestProjectInactivate(Packet):
 
 
 class RequestProjectReactivate(Packet):
+    __slots__ = ()
     _packet_type = 'request_project_reactivate'
     _expected_reply = [{'type': 'notify_project_reactivate', 'timeout': 30240}]
     _data_keys_required = ['ProjectID', 'ResourceList']
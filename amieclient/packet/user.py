@@ -6,6 +6,7 @@ from .base import Packet, PacketInvalidData
 
 
 class NotifyUserModify(Packet):
+    __slots__ = ()
     _packet_type = 'notify_account_inactivate'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = [
@@ -47,6 +48,7 @@ class NotifyUserModify(Packet):
 
 
 class RequestUserModify(Packet):
+    __slots__ = ()
     _packet_type = 'request_user_modify'
     _expected_reply = [{'type': 'inform_transaction_complete', 'timeout': 30240}]
     _data_keys_required = [
@@ -11,7 +11,7 @@ def _validate_resource_list(pkt):
     ResourceLists must only have one element in them.
     A bit weird, yes, but that's the spec.
     """
-    rlist = pkt._required_data.get('ResourceList')
+    rlist = pkt._data.get('ResourceList')
     if rlist is not None:
         if not isinstance(rlist, list):
             raise PacketInvalidData("ResourceList must be a list")
@@ -1,9 +1,32 @@
+import weakref
+
+from datetime import datetime
+from types import MappingProxyType
+
 import pytest
 
 from ..packet import (Packet, RequestAccountCreate, Packet, PacketInvalidData,
+                      PacketInvalidType,
                       NotifyAccountCreate, NotifyPersonDuplicate,
-                      NotifyUserModify, RequestUserModify)
-from .fixtures import DEMO_JSON_PKT_1, DEMO_JSON_PKT_2
+                      NotifyUserModify, PacketList, RequestProjectCreate,
+                      RequestUserModify)
+from ..packet import base, packetlist
+from .fixtures import DEMO_JSON_PKT_1, DEMO_JSON_PKT_2, DEMO_JSON_PKT_LIST
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """
+    Runs a test with orjson, if it's installed, and with the json module
+    fallback
+    """
+    if request.param == 'orjson':
+        if base._json_fast is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(base, '_json_fast', None)
+        monkeypatch.setattr(packetlist, '_json_fast', None)
+    return request.param
 
 
 class TestClient:
@@ -19,6 +42,17 @@ class TestClient:
         assert packet.packet_type == 'request_account_create'
         assert isinstance(packet, RequestAccountCreate)
 
+    def test_find_packet_type(self):
+        """
+        Packet classes are found by type name or by packet instance, and
+        unknown types raise an error
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        assert Packet._find_packet_type('request_account_create') is RequestAccountCreate
+        assert Packet._find_packet_type(packet) is RequestAccountCreate
+        with pytest.raises(PacketInvalidType):
+            Packet._find_packet_type('request_a_pony')
+
     def test_additional_data(self):
         """
         Test that additional data is stored properly
@@ -30,15 +64,30 @@ class TestClient:
         assert 'UserFavoriteColor' in packet.additional_data
         assert packet.additional_data['UserFavoriteColor'] == 'blue'
 
+    def test_additional_data_not_shared(self):
+        """
+        Packets get their own additional data dict, and don't modify one
+        that's passed in
+        """
+        extra = {'UserFavoriteColor': 'blue'}
+        packet_1 = RequestAccountCreate(additional_data=extra, UserFavoriteFood='pie')
+        packet_2 = RequestAccountCreate(UserFavoriteFood='cake')
+        packet_3 = RequestAccountCreate()
+        assert extra == {'UserFavoriteColor': 'blue'}
+        assert packet_1.additional_data == {'UserFavoriteColor': 'blue',
+                                            'UserFavoriteFood': 'pie'}
+        assert packet_2.additional_data == {'UserFavoriteFood': 'cake'}
+        assert packet_3.additional_data == {}
+
     def test_required_data_storage(self):
         """
         Required data is stored in the proper location on a created packet
         """
         packet = Packet.from_dict(DEMO_JSON_PKT_1)
         for k in RequestAccountCreate._data_keys_required:
-            assert k in packet._required_data
+            assert k in packet._data
             assert getattr(packet, k) == DEMO_JSON_PKT_1['body'].get(k)
-            assert packet._required_data.get(k) == DEMO_JSON_PKT_1['body'].get(k)
+            assert packet._data.get(k) == DEMO_JSON_PKT_1['body'].get(k)
 
     def test_required_data_delete_is_none(self):
         """
@@ -49,7 +98,7 @@ class TestClient:
         for k in RequestAccountCreate._data_keys_required:
             delattr(packet, k)
             assert getattr(packet, k) is None
-            assert packet._required_data[k] is None
+            assert packet._data[k] is None
 
     def test_allowed_data_storage(self):
         """
@@ -58,9 +107,45 @@ class TestClient:
         """
         packet = Packet.from_dict(DEMO_JSON_PKT_1)
         for k in RequestAccountCreate._data_keys_allowed:
-            if k in packet._allowed_data:
+            if k in packet._data:
                 assert getattr(packet, k) == DEMO_JSON_PKT_1['body'].get(k)
-                assert packet._allowed_data.get(k) == DEMO_JSON_PKT_1['body'].get(k)
+                assert packet._data.get(k) == DEMO_JSON_PKT_1['body'].get(k)
+
+    def test_unknown_attribute(self):
+        """
+        Names that aren't data fields or packet attributes can't be set or
+        read, since packets don't carry an instance __dict__
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        assert not hasattr(packet, '__dict__')
+        with pytest.raises(AttributeError):
+            packet.NotAnAmieField
+        with pytest.raises(AttributeError):
+            packet.NotAnAmieField = 'value'
+
+    def test_weakref(self):
+        """
+        Packets can be weakly referenced, despite using __slots__
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        assert weakref.ref(packet)() is packet
+
+    def test_subclass_attributes(self):
+        """
+        Data fields are properties on the class, and subclasses of packet
+        types that don't declare __slots__ can set their own attributes
+        """
+        assert isinstance(RequestAccountCreate.ResourceList, property)
+
+        class NotedRequestAccountCreate(RequestAccountCreate):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.note = 'x'
+
+        packet = NotedRequestAccountCreate(ProjectID='TG-123')
+        assert packet.note == 'x'
+        assert packet.ProjectID == 'TG-123'
+        assert packet.packet_type == 'request_account_create'
 
     def test_reply_packet_validation(self):
         """
@@ -80,6 +165,25 @@ class TestClient:
             # Replace the data so we're not double-testing
             setattr(reply_packet, k, v)
 
+    def test_in_reply_to_types(self):
+        """
+        in_reply_to accepts None, a packet ID as a string or int, or the
+        packet itself, either as an object or a dict-like object
+        """
+        parent_packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        parent_id = parent_packet.packet_rec_id
+        for in_reply_to in [str(parent_id), parent_id, parent_packet,
+                            DEMO_JSON_PKT_1, MappingProxyType(DEMO_JSON_PKT_1)]:
+            packet = NotifyAccountCreate(in_reply_to=in_reply_to)
+            assert packet.in_reply_to_id == parent_id
+        assert NotifyAccountCreate(in_reply_to=None).in_reply_to_id is None
+
+        # Anything else is an error, rather than silently not a reply
+        for in_reply_to in [float(parent_id), [parent_id], {'foo': 1},
+                            {'header': {'packet_id': 1}}]:
+            with pytest.raises(PacketInvalidData, match='in_reply_to'):
+                NotifyAccountCreate(in_reply_to=in_reply_to)
+
     def test_reply_packet_missing(self):
         """
         The in_reply_to field and the packet type are properly set on a packet
@@ -230,3 +334,113 @@ class TestClient:
 
         with pytest.raises(PacketInvalidData):
             rac_packet.validate_data(raise_on_invalid=True)
+
+    def test_json_roundtrip(self, json_backend):
+        """
+        A packet serialized to JSON and parsed back has the same data,
+        whether or not orjson is available
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        packet_2 = Packet.from_json(packet.json())
+        assert packet_2.as_dict() == packet.as_dict()
+
+    def test_as_dict_body(self):
+        """
+        as_dict() leaves out unset data and converts dates to ISO strings
+        """
+        rpc = RequestProjectCreate(StartDate='2021-03-01T12:00:00',
+                                   GrantNumber='TG-123', UserFavoriteColor='blue')
+        rpc.EndDate = datetime(2021, 6, 1)
+        body = rpc.as_dict()['body']
+        assert body == {
+            'StartDate': '2021-03-01T12:00:00',
+            'EndDate': '2021-06-01T00:00:00',
+            'GrantNumber': 'TG-123',
+            'UserFavoriteColor': 'blue',
+        }
+
+    @pytest.mark.parametrize('date_str', ['2021-03-01T12:30:00',
+                                          '2021-03-01T12:30:00.123456-04:00',
+                                          '2021-03-01T12:30:00Z',
+                                          '2021-03-01',
+                                          'March 1 2021 12:30PM'])
+    def test_parse_date(self, date_str):
+        """
+        ISO 8601 dates and other formats parse the same as with dateutil
+        """
+        from dateutil.parser import parse as dtparse
+        from ..packet.base import _parse_date
+        assert _parse_date(date_str) == dtparse(date_str)
+
+    def test_json_cache(self):
+        """
+        json(cache=True) output is cached until the packet changes, and
+        json() without it doesn't use the cache
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        json_1 = packet.json(cache=True)
+        assert packet.json(cache=True) is json_1
+        assert packet.json() is not json_1
+        assert packet.json() == json_1
+
+        # Copy the list, so we don't modify the fixture below
+        packet.ResourceList = list(packet.ResourceList)
+        json_2 = packet.json(cache=True)
+        assert json_2 is not json_1
+
+        # Header changes show up without an explicit invalidation
+        packet.packet_state = 'completed'
+        json_3 = packet.json(cache=True)
+        assert '"completed"' in json_3
+        assert packet.json(cache=True) is json_3
+        packet.date = datetime(2020, 1, 1)
+        json_4 = packet.json(cache=True)
+        assert '2020-01-01T00:00:00' in json_4
+        packet.additional_data = {'UserFavoriteColor': 'green'}
+        assert '"green"' in packet.json(cache=True)
+
+        # In-place changes need an explicit invalidation
+        json_5 = packet.json(cache=True)
+        packet.ResourceList.append('clever-hans.psc.edu')
+        assert packet.json(cache=True) is json_5
+        packet.invalidate_json()
+        assert 'clever-hans.psc.edu' in packet.json(cache=True)
+
+    def test_from_bytes(self, json_backend):
+        """
+        Packets can be created from JSON bytes, a bytearray or a memoryview,
+        but not from a string, with either JSON backend
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        json_str = packet.json()
+        json_bytes = json_str.encode('utf-8')
+        for data in [json_bytes, bytearray(json_bytes), memoryview(json_bytes)]:
+            assert Packet.from_bytes(data).as_dict() == packet.as_dict()
+        with pytest.raises(TypeError):
+            Packet.from_bytes(json_str)
+        with pytest.raises(TypeError):
+            PacketList.from_bytes(PacketList(packets=[packet]).json())
+
+    def test_packet_list_json(self, json_backend):
+        """
+        A PacketList serialized to JSON parses back the same, from either
+        a string or bytes
+        """
+        pkt_list = PacketList.from_dict(DEMO_JSON_PKT_LIST)
+        json_str = pkt_list.json()
+        assert PacketList.from_json(json_str).as_dict() == pkt_list.as_dict()
+        assert PacketList.from_bytes(json_str.encode('utf-8')).as_dict() == pkt_list.as_dict()
+
+    def test_json_non_ascii(self, json_backend):
+        """
+        Non-ASCII data survives serialization with either JSON backend,
+        though only the json module escapes it
+        """
+        packet = Packet.from_dict(DEMO_JSON_PKT_1)
+        packet.additional_data['UserFavoriteColor'] = 'bleu ciel \u00e9'
+        json_str = packet.json()
+        if json_backend == 'orjson':
+            assert '\u00e9' in json_str
+        else:
+            assert '\\u00e9' in json_str
+        assert Packet.from_json(json_str).additional_data['UserFavoriteColor'] == 'bleu ciel \u00e9'
@@ -11,6 +11,9 @@ setup(
         'requests>=2.20.0,<3',
         'python-dateutil>=2.6.1,<2.7'
     ],
+    extras_require={
+        'fast': ['orjson'],
+    },
     author='G. Ryan Sablosky',
     author_email='sablosky@psc.edu',
     python_requires='>=3.5',